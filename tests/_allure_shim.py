@@ -0,0 +1,41 @@
+"""
+Allure import shim.
+
+Importing this module yields the real `allure` package when installed and
+a no-op stand-in otherwise. Keeping the fallback here means test modules
+(re-imported per xdist worker) pay the try/except and class construction
+only once, via Python's module cache.
+"""
+
+try:
+    import allure
+    ALLURE_AVAILABLE = True
+except ImportError:
+    ALLURE_AVAILABLE = False
+
+    # Dummy decorators matching the allure API surface used by the tests
+    class allure:
+        @staticmethod
+        def feature(name):
+            return lambda func: func
+
+        @staticmethod
+        def story(name):
+            return lambda func: func
+
+        @staticmethod
+        def severity(level):
+            return lambda func: func
+
+        @staticmethod
+        def step(name):
+            def decorator(func):
+                return func
+            return decorator
+
+        class severity_level:
+            BLOCKER = "blocker"
+            CRITICAL = "critical"
+            NORMAL = "normal"
+            MINOR = "minor"
+            TRIVIAL = "trivial"
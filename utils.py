@@ -4,21 +4,142 @@ Utility Functions for SwiftAssess Test Automation
 
 from datetime import datetime
 from faker import Faker
+import atexit
+import functools
+import io
+import itertools
+import json
+import os
 import random
+import re
 import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-fake = Faker()
+# Selenium is optional at import time so data-only consumers (pure
+# data-generation or validation tests) can use utils without a browser
+# stack installed; only the wait helpers need these names.
+try:
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import StaleElementReferenceException
+except ImportError:
+    WebDriverWait = EC = StaleElementReferenceException = None
+
+
+class CachedFaker:
+    """Memoizing proxy around a Faker instance.
+
+    Repeated generator calls with identical arguments return the cached
+    value instead of re-running Faker's provider dispatch - useful in CI
+    where reruns of the same parameterized tests regenerate data that is
+    never inspected. Enable with FAKER_CACHE=1; set FAKER_CACHE_FILE to
+    persist the cache between runs.
+    """
+
+    def __init__(self, faker, path=None):
+        self._faker = faker
+        self._path = path
+        self._cache = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._cache = json.load(f)
+            except (ValueError, OSError):
+                self._cache = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self._faker, name)
+        if not callable(attr):
+            return attr
+
+        def cached(*args, **kwargs):
+            key = json.dumps([name, args, sorted(kwargs.items())], default=str)
+            if key in self._cache:
+                return self._cache[key]
+            value = attr(*args, **kwargs)
+            self._cache[key] = value
+            return value
+
+        return cached
+
+    def flush(self):
+        """Persist the cache to disk (no-op without a cache file)"""
+        if not self._path:
+            return
+        try:
+            with open(self._path, "w") as f:
+                json.dump(self._cache, f)
+        except (TypeError, OSError):
+            pass
+
+
+# Lazily-initialized Faker: provider loading is deferred to first use, so
+# suites that only need emails/account names never pay for it
+_fake = None
+
+
+def _get_faker():
+    """Return the process-local Faker, creating (and seeding) it on first use"""
+    global _fake
+    if _fake is None:
+        _fake = Faker()
+        seed = os.getenv("FAKER_SEED")
+        if seed:
+            Faker.seed(int(seed))
+        if os.getenv("FAKER_CACHE") == "1":
+            _fake = CachedFaker(_fake, os.getenv("FAKER_CACHE_FILE"))
+            atexit.register(_fake.flush)
+    return _fake
+
+# Hoisted so batch generation doesn't rebuild these per record
+_COUNTRIES = (
+    "United States", "United Kingdom", "Canada",
+    "Australia", "Germany", "France",
+)
+_ACCOUNT_TYPES = ("School", "College", "General")
+
+# Fixed negative-test corpora; tuples so callers can't mutate the shared
+# instance returned by the generate_invalid_* helpers
+_INVALID_EMAILS = (
+    "invalid@",
+    "invalid.com",
+    "@example.com",
+    "test@",
+    "test..email@example.com",
+    "test email@example.com",
+    "test@domain",
+    "test@@example.com",
+    "test@.com",
+    ".test@example.com",
+    "test@domain..com",
+)
+_INVALID_ACCOUNTS = (
+    ("ab", "Too short - less than 5 characters"),
+    ("test", "Too short - only 4 characters"),
+    ("test name", "Contains space"),
+    ("test-name", "Contains special character"),
+    ("test@name", "Contains special character"),
+    ("test.name", "Contains period"),
+    ("TEST NAME", "Contains space and uppercase"),
+)
+
+
+# Email uniqueness: one timestamp per process plus a monotonic counter.
+# Cheaper than formatting datetime.now() per call, and collision-free
+# within a run (the randint scheme could repeat within the same second).
+_EMAIL_PREFIX_TS = datetime.now().strftime("%Y%m%d%H%M%S")
+_email_counter = itertools.count()
 
 
 class TestDataGenerator:
     """Generate test data for signup forms"""
-    
+
     @staticmethod
     def generate_email(prefix="test"):
         """Generate unique email address"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        random_num = random.randint(1000, 9999)
-        return f"{prefix}{timestamp}{random_num}@example.com"
+        return f"{prefix}{_EMAIL_PREFIX_TS}{next(_email_counter):06d}@example.com"
     
     @staticmethod
     def generate_account_name(length=10):
@@ -29,91 +150,139 @@ class TestDataGenerator:
     @staticmethod
     def generate_organization_name():
         """Generate organization name"""
-        return fake.company()
-    
+        return _get_faker().company()
+
     @staticmethod
     def generate_full_name():
         """Generate full name"""
-        return fake.name()
+        return _get_faker().name()
     
     @staticmethod
     def generate_invalid_emails():
-        """Generate list of invalid email formats"""
-        return [
-            "invalid@",
-            "invalid.com",
-            "@example.com",
-            "test@",
-            "test..email@example.com",
-            "test email@example.com",
-            "test@domain",
-            "test@@example.com",
-            "test@.com",
-            ".test@example.com",
-            "test@domain..com",
-        ]
-    
+        """Return the fixed list of invalid email formats"""
+        return _INVALID_EMAILS
+
     @staticmethod
     def generate_invalid_account_names():
-        """Generate invalid account names with reasons"""
+        """Return the fixed invalid account names with reasons"""
+        return _INVALID_ACCOUNTS
+    
+    @staticmethod
+    def generate_valid_test_data_batch(n):
+        """Generate n complete valid test data records in one pass.
+
+        Per-record overhead is kept flat: the random picks are drawn with
+        a single random.choices(k=n) per field and the Faker methods are
+        bound outside the loop. Emails and account names take their
+        sequence numbers from the shared process-wide counter, so they
+        are unique per record and across batches within a run.
+        """
+        faker = _get_faker()
+        company = faker.company
+        full_name = faker.name
+        seqs = [next(_email_counter) for _ in range(n)]
+        countries = random.choices(_COUNTRIES, k=n)
+        account_types = random.choices(_ACCOUNT_TYPES, k=n)
         return [
-            ("ab", "Too short - less than 5 characters"),
-            ("test", "Too short - only 4 characters"),
-            ("test name", "Contains space"),
-            ("test-name", "Contains special character"),
-            ("test@name", "Contains special character"),
-            ("test.name", "Contains period"),
-            ("TEST NAME", "Contains space and uppercase"),
+            {
+                "organization": company(),
+                "name": full_name(),
+                "email": f"test{_EMAIL_PREFIX_TS}{seq:06d}@example.com",
+                "country": country,
+                "account_type": account_type,
+                "account_name": f"test{seq:06d}",
+                "captcha": "12345"  # Mock value
+            }
+            for seq, country, account_type in zip(seqs, countries, account_types)
         ]
-    
+
     @staticmethod
-    def generate_valid_test_data():
-        """Generate complete valid test data"""
+    def generate_valid_test_data_columns(n):
+        """Generate n valid records column-wise (structure of arrays).
+
+        Returns one list per field instead of n dicts, which skips the
+        per-record dict construction and suits callers that only consume
+        a column or two (e.g. feeding every email to a bulk validator).
+        Use to_records() to get row dicts back when needed.
+        """
+        faker = _get_faker()
+        company = faker.company
+        full_name = faker.name
+        seqs = [next(_email_counter) for _ in range(n)]
         return {
-            "organization": TestDataGenerator.generate_organization_name(),
-            "name": TestDataGenerator.generate_full_name(),
-            "email": TestDataGenerator.generate_email(),
-            "country": random.choice([
-                "United States", "United Kingdom", "Canada", 
-                "Australia", "Germany", "France"
-            ]),
-            "account_type": random.choice(["School", "College", "General"]),
-            "account_name": TestDataGenerator.generate_account_name(),
-            "captcha": "12345"  # Mock value
+            "organization": [company() for _ in range(n)],
+            "name": [full_name() for _ in range(n)],
+            "email": [f"test{_EMAIL_PREFIX_TS}{seq:06d}@example.com" for seq in seqs],
+            "country": random.choices(_COUNTRIES, k=n),
+            "account_type": random.choices(_ACCOUNT_TYPES, k=n),
+            "account_name": [f"test{seq:06d}" for seq in seqs],
+            "captcha": ["12345"] * n,  # Mock value
         }
 
+    @staticmethod
+    def to_records(columns):
+        """Turn a generate_valid_test_data_columns() result into row dicts"""
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    @staticmethod
+    def generate_valid_test_data():
+        """Generate complete valid test data"""
+        return TestDataGenerator.generate_valid_test_data_batch(1)[0]
+
 
 class WaitHelpers:
     """Custom wait helper functions"""
-    
+
+    @staticmethod
+    def wait_for_idle(driver, timeout=30):
+        """Wait for page load and pending jQuery AJAX in one polling loop.
+
+        Combines wait_for_page_load + wait_for_ajax into a single
+        predicate so each poll costs one execute_script instead of two,
+        and pages without jQuery pass immediately.
+        """
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            lambda d: d.execute_script(
+                "return document.readyState === 'complete'"
+                " && (typeof window.jQuery === 'undefined' || window.jQuery.active === 0);"
+            )
+        )
+
     @staticmethod
     def wait_for_page_load(driver, timeout=30):
-        """Wait for page to fully load"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        
-        WebDriverWait(driver, timeout).until(
+        """Wait for page to fully load (prefer wait_for_idle)"""
+        WebDriverWait(
+            driver, timeout,
+            poll_frequency=ConfigHelper.get_poll_interval(),
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
-    
+
     @staticmethod
     def wait_for_ajax(driver, timeout=30):
-        """Wait for jQuery AJAX calls to complete"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        
-        try:
-            WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script("return jQuery.active == 0")
+        """Wait for jQuery AJAX calls to complete (prefer wait_for_idle)"""
+        # The predicate itself treats a jQuery-less page as "no AJAX
+        # pending", so there is no JS error to swallow and no waiting out
+        # the full timeout just because jQuery never loaded.
+        WebDriverWait(
+            driver, timeout,
+            poll_frequency=ConfigHelper.get_poll_interval(),
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(
+            lambda d: d.execute_script(
+                "return typeof window.jQuery === 'undefined' || window.jQuery.active === 0;"
             )
-        except:
-            pass  # jQuery might not be present
+        )
     
     @staticmethod
     def wait_for_element_to_disappear(driver, locator, timeout=10):
         """Wait for element to disappear"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(
+            driver, timeout,
+            poll_frequency=ConfigHelper.get_poll_interval(),
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(
             EC.invisibility_of_element_located(locator)
         )
 
@@ -125,32 +294,154 @@ class ScreenshotHelper:
     def take_full_page_screenshot(driver, filename):
         """Take screenshot of entire page (scrolling)"""
         original_size = driver.get_window_size()
-        required_width = driver.execute_script(
-            "return document.body.parentNode.scrollWidth"
+        # Both dimensions in one round trip instead of two script calls
+        required_width, required_height = driver.execute_script(
+            "var e = document.body.parentNode;"
+            " return [e.scrollWidth, e.scrollHeight];"
         )
-        required_height = driver.execute_script(
-            "return document.body.parentNode.scrollHeight"
+
+        needs_resize = (required_width, required_height) != (
+            original_size['width'], original_size['height']
         )
-        
-        driver.set_window_size(required_width, required_height)
+        if needs_resize:
+            driver.set_window_size(required_width, required_height)
         driver.save_screenshot(filename)
-        driver.set_window_size(original_size['width'], original_size['height'])
+        if needs_resize:
+            driver.set_window_size(original_size['width'], original_size['height'])
     
+    @staticmethod
+    def take_full_page_screenshot_bytes(driver):
+        """Full-page screenshot as PNG bytes, with no disk write.
+
+        Pair with DeferredScreenshots to only persist captures when a
+        test actually fails.
+        """
+        original_size = driver.get_window_size()
+        required_width, required_height = driver.execute_script(
+            "var e = document.body.parentNode;"
+            " return [e.scrollWidth, e.scrollHeight];"
+        )
+
+        needs_resize = (required_width, required_height) != (
+            original_size['width'], original_size['height']
+        )
+        if needs_resize:
+            driver.set_window_size(required_width, required_height)
+        png = driver.get_screenshot_as_png()
+        if needs_resize:
+            driver.set_window_size(original_size['width'], original_size['height'])
+        return png
+
+    @staticmethod
+    def take_screenshots_parallel(drivers_and_filenames, max_workers=8):
+        """Capture screenshots from several drivers concurrently.
+
+        Each capture is an HTTP request that mostly waits on the browser,
+        so a thread pool overlaps them. drivers_and_filenames is an
+        iterable of (driver, filename) pairs; each driver must appear at
+        most once, since a single WebDriver session is not thread-safe.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            # list() drains the iterator so worker exceptions propagate
+            list(ex.map(
+                lambda pair: ScreenshotHelper.take_full_page_screenshot(*pair),
+                drivers_and_filenames,
+            ))
+
     @staticmethod
     def take_element_screenshot(driver, element, filename):
         """Take screenshot of specific element"""
         element.screenshot(filename)
 
 
+class DeferredScreenshots:
+    """Collect screenshots in memory and persist them only on failure.
+
+    Usage:
+        with DeferredScreenshots() as shots:
+            shots.add("step1.png", ScreenshotHelper.take_full_page_screenshot_bytes(driver))
+            ...
+
+    Files are written in __exit__ only if an exception propagated, so
+    passing tests never touch the filesystem. Call flush() to persist
+    explicitly (e.g. from a pytest hook when rep_call.failed).
+    """
+
+    def __init__(self, directory="test_screenshots"):
+        self.directory = directory
+        self._shots = []
+
+    def add(self, name, png_bytes):
+        """Queue a named screenshot for potential persistence"""
+        self._shots.append((name, png_bytes))
+
+    def flush(self):
+        """Write all collected screenshots to disk and clear the queue"""
+        os.makedirs(self.directory, exist_ok=True)
+        for name, png in self._shots:
+            with open(os.path.join(self.directory, name), "wb") as f:
+                f.write(png)
+        self._shots.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.flush()
+        return False
+
+
+# Compiled once: re.match with a str pattern hits the compile cache but
+# still hashes the pattern string on every call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Optional Hyperscan database for bulk validation: the same pattern
+# compiled to a DFA, scanned in native code with no backtracking
+try:
+    import hyperscan
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[rb'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'],
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+except ImportError:
+    _HS_DB = None
+
+
+# Deletion table for the permitted account-name characters: translate()
+# strips them in a single C-level pass, so anything left over is invalid
+_ACCT_DELETE = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+
 class ValidationHelper:
     """Validation helper functions"""
-    
+
     @staticmethod
     def is_valid_email(email):
         """Basic email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
+
+    @staticmethod
+    def is_valid_email_bulk(emails):
+        """Validate a batch of emails, returning one boolean per input.
+
+        Uses the Hyperscan DFA when python-hyperscan is installed; falls
+        back to the precompiled re pattern otherwise. Only worthwhile for
+        large batches - single checks should keep using is_valid_email.
+        """
+        if _HS_DB is None:
+            match = _EMAIL_RE.match
+            return [match(email) is not None for email in emails]
+        results = []
+        for email in emails:
+            matched = []
+            _HS_DB.scan(
+                email.encode(),
+                match_event_handler=lambda *args: matched.append(True),
+            )
+            results.append(bool(matched))
+        return results
     
     @staticmethod
     def is_valid_account_name(account_name):
@@ -159,11 +450,24 @@ class ValidationHelper:
             return False, "Must be at least 5 characters"
         if ' ' in account_name:
             return False, "No spaces allowed"
-        if not account_name.replace('_', '').replace('-', '').isalnum():
+        if account_name.translate(_ACCT_DELETE):
             return False, "Only alphanumeric characters allowed"
         return True, "Valid"
 
 
+# Highlighting is for human observers only; automated runs default to a
+# no-op so the test thread never sleeps just to show a border
+_HIGHLIGHT = os.getenv("HIGHLIGHT_ELEMENTS", "0") == "1"
+
+# Known mobile viewport dimensions (width, height)
+_DEVICES = {
+    "iphone_x": (375, 812),
+    "iphone_12": (390, 844),
+    "samsung_s21": (360, 800),
+    "ipad": (768, 1024),
+}
+
+
 class BrowserHelper:
     """Browser-related helper functions"""
     
@@ -171,22 +475,21 @@ class BrowserHelper:
     def clear_browser_data(driver):
         """Clear cookies and storage"""
         driver.delete_all_cookies()
-        driver.execute_script("window.localStorage.clear();")
-        driver.execute_script("window.sessionStorage.clear();")
+        # Both storages in one script call: each execute_script is a
+        # WebDriver HTTP round trip
+        driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();"
+        )
     
     @staticmethod
     def set_mobile_viewport(driver, device="iphone_x"):
         """Set viewport to mobile dimensions"""
-        devices = {
-            "iphone_x": (375, 812),
-            "iphone_12": (390, 844),
-            "samsung_s21": (360, 800),
-            "ipad": (768, 1024),
-        }
-        
-        width, height = devices.get(device, devices["iphone_x"])
+        width, height = _DEVICES.get(device, _DEVICES["iphone_x"])
         driver.set_window_size(width, height)
-    
+
+    # set_viewport_iphone_x(driver) etc., one per _DEVICES entry, are
+    # attached below the class body.
+
     @staticmethod
     def scroll_to_element(driver, element):
         """Scroll element into view"""
@@ -194,89 +497,151 @@ class BrowserHelper:
     
     @staticmethod
     def highlight_element(driver, element, duration=2):
-        """Highlight element for debugging"""
-        original_style = element.get_attribute("style")
+        """Highlight element for debugging (no-op unless HIGHLIGHT_ELEMENTS=1).
+
+        The style is restored by a setTimeout inside the browser, so
+        Python never blocks waiting for the highlight to fade.
+        """
+        if not _HIGHLIGHT:
+            return
         driver.execute_script(
-            "arguments[0].setAttribute('style', arguments[1]);",
-            element,
-            "border: 3px solid red; background-color: yellow;"
+            """
+            const el = arguments[0], orig = el.getAttribute('style');
+            el.style.cssText = 'border: 3px solid red; background-color: yellow;';
+            setTimeout(() => el.setAttribute('style', orig || ''), arguments[1]);
+            """,
+            element, int(duration * 1000)
         )
-        import time
-        time.sleep(duration)
-        driver.execute_script(
-            "arguments[0].setAttribute('style', arguments[1]);",
-            element,
-            original_style
+
+
+# Per-device convenience wrappers (set_viewport_iphone_x, ...), generated
+# from _DEVICES so the table stays the single source of truth
+for _name, (_w, _h) in _DEVICES.items():
+    setattr(BrowserHelper, f"set_viewport_{_name}",
+            staticmethod(lambda driver, _w=_w, _h=_h: driver.set_window_size(_w, _h)))
+del _name, _w, _h
+
+
+# Buffered log output: per-line print() pays a syscall (plus terminal
+# emulation on Windows CI) for every write; a 64 KiB buffer amortizes
+# that. Falls back to plain stdout when the stream has no binary buffer
+# (e.g. under pytest's output capture).
+def _make_log_stream():
+    try:
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, buffer_size=65536),
+            write_through=False,
         )
+    except (AttributeError, io.UnsupportedOperation):
+        return sys.stdout
+    atexit.register(stream.flush)
+    return stream
+
+
+_LOG_STREAM = _make_log_stream()
 
 
 class ReportHelper:
     """Reporting helper functions"""
-    
+
     @staticmethod
     def log_test_step(step_name, status="INFO"):
-        """Log test step"""
+        """Log test step (buffered; see force_flush)"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] [{status}] {step_name}")
-    
+        _LOG_STREAM.write(f"[{timestamp}] [{status}] {step_name}\n")
+
     @staticmethod
     def log_test_data(data_dict):
         """Log test data for debugging"""
-        print("\n" + "="*50)
-        print("Test Data:")
-        for key, value in data_dict.items():
-            # Mask sensitive data
-            if key.lower() in ['password', 'captcha', 'security']:
-                value = "*" * len(str(value))
-            print(f"  {key}: {value}")
-        print("="*50 + "\n")
+        sep = "=" * 50
+        body = "".join(
+            f"  {key}: {'*' * len(str(value)) if key.lower() in ('password', 'captcha', 'security') else value}\n"
+            for key, value in data_dict.items()
+        )
+        # One write for the whole block instead of one per key
+        _LOG_STREAM.write(f"\n{sep}\nTest Data:\n{body}{sep}\n\n")
+
+    @staticmethod
+    def force_flush():
+        """Flush buffered log output; call this on failure paths"""
+        _LOG_STREAM.flush()
 
 
 class RetryHelper:
     """Retry mechanism for flaky operations"""
     
     @staticmethod
-    def retry_on_exception(func, max_attempts=3, delay=1, exceptions=(Exception,)):
-        """Retry function on specific exceptions"""
-        import time
-        
+    def retry_on_exception(func, max_attempts=3, base_delay=1.0, max_delay=30.0,
+                           jitter=0.5, exceptions=(Exception,), unrecoverable=()):
+        """Retry function with capped, jittered exponential backoff.
+
+        Delays grow as base_delay * 2**attempt, randomized by +/-jitter
+        and capped at max_delay: the common first retry stays fast while
+        slow-recoverable failures back off instead of hammering, and the
+        jitter keeps concurrent retriers from synchronizing. Exception
+        types listed in `unrecoverable` re-raise immediately.
+        """
         for attempt in range(max_attempts):
             try:
                 return func()
+            except unrecoverable:
+                raise
             except exceptions as e:
                 if attempt == max_attempts - 1:
                     raise
-                print(f"Attempt {attempt + 1} failed: {e}. Retrying...")
+                delay = min(
+                    max_delay,
+                    base_delay * (2 ** attempt) * (1 + random.uniform(-jitter, jitter)),
+                )
+                print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
                 time.sleep(delay)
 
 
 class ConfigHelper:
-    """Configuration helper"""
-    
+    """Configuration helper.
+
+    Values are parsed from the environment once and memoized; call
+    reset_cache() after mutating env vars (e.g. in tests).
+    """
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_base_url():
         """Get base URL from environment or default"""
-        import os
         return os.getenv("BASE_URL", "https://app.swiftassess.com")
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_browser():
         """Get browser choice from environment"""
-        import os
         return os.getenv("BROWSER", "chrome").lower()
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_headless():
         """Check if tests should run headless"""
-        import os
         return os.getenv("HEADLESS", "false").lower() == "true" or os.getenv("CI", "false").lower() == "true"
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_timeout():
         """Get default timeout"""
-        import os
         return int(os.getenv("DEFAULT_TIMEOUT", "10"))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_poll_interval():
+        """WebDriverWait poll interval in seconds (default 100ms)"""
+        return float(os.getenv("SELENIUM_POLL_INTERVAL", "0.1"))
+
+    @staticmethod
+    def reset_cache():
+        """Clear memoized config after mutating the environment"""
+        for method in (ConfigHelper.get_base_url, ConfigHelper.get_browser,
+                       ConfigHelper.is_headless, ConfigHelper.get_timeout,
+                       ConfigHelper.get_poll_interval):
+            method.cache_clear()
+
 
 # Example usage in tests:
 """